@@ -161,6 +161,18 @@ class CompTable:
         """
         return set.union(*self._table.values(), set())
 
+    def has_set(self, c_set: ComponentSet) -> bool:
+        """
+        Returns whether the given component set is currently tracked in this table.
+
+        :param c_set: the component set
+        :return: True if the component set is tracked in this table, False otherwise
+        """
+        return any(c_set in self._table.get(node, ()) for node in c_set)
+
+    def __contains__(self, key: Supernode) -> bool:
+        return key in self._table
+
     def __getitem__(self, key: Supernode) -> Set[ComponentSet]:
         return self._table[key]
 
@@ -1,8 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, Set, Optional, FrozenSet
+from typing import Callable, Dict, Any, Set, Optional, FrozenSet, Iterable, Tuple, List, Collection
 
 from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge
 from multilevelgraphs.contraction_schemes import CompTable, UpdateQuadruple, ComponentSet
+from multilevelgraphs.utilities import ParUtils
+
+
+def _no_attr(element: Any) -> Dict[str, Any]:
+    """
+    Default attribute function of contraction schemes, assigning no attributes.
+    Being a single module-level function, it is preserved by identity when a scheme is cloned, so that schemes
+    can recognize the absence of attribute functions.
+    """
+    return {}
+
+
+def _partition_edges(tail_indices: List[int], head_indices: List[int], order: int) \
+        -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+    """
+    Partitions a list of edges, given as the supernode indices of their tails and heads, by pair of supernodes.
+    Only plain integers are involved, with each pair of indices encoded as the single integer
+    ``tail_index * order + head_index``.
+
+    :param tail_indices: the supernode index of the tail of each edge
+    :param head_indices: the supernode index of the head of each edge
+    :param order: the number of supernodes
+    :return: the positions of the edges having tail and head in the same supernode, grouped by supernode index,
+        and the positions of the other edges, grouped by encoded pair of supernode indices
+    """
+    intra_groups: Dict[int, List[int]] = dict()
+    inter_groups: Dict[int, List[int]] = dict()
+    for position, (tail_index, head_index) in enumerate(zip(tail_indices, head_indices)):
+        if tail_index == head_index:
+            group = intra_groups.get(tail_index)
+            if group is None:
+                intra_groups[tail_index] = [position]
+            else:
+                group.append(position)
+        else:
+            pair = tail_index * order + head_index
+            group = inter_groups.get(pair)
+            if group is None:
+                inter_groups[pair] = [position]
+            else:
+                group.append(position)
+    return intra_groups, inter_groups
 
 
 class ContractionScheme(ABC):
@@ -17,13 +59,22 @@ class ContractionScheme(ABC):
     Along with the definition of the contraction function, provided by the method contraction_function, a contraction
     scheme should define methods to update the contracted decontractible graph according to the changes in the lower
     level decontractible graph. Those methods are ``_update_added_node``, ``_update_removed_node``,
-    ``_update_added_edge`` and ``_update_removed_edge``.
+    ``_update_added_edge`` and ``_update_removed_edge``. Their batched counterparts, ``_update_added_nodes``,
+    ``_update_removed_nodes``, ``_update_added_edges`` and ``_update_removed_edges``, can be overridden as well
+    when a batch of changes can be processed more efficiently than its elements one by one.
 
     When a contraction scheme is constructed, it can be initialized with attribute functions for supernodes, superedges
     and component sets. These functions produce a dictionary of key-value pairs that are used to assign attributes to
     the supernodes and superedges of the produced contracted decontractible graph, as well as to the component sets
     tracked by the component set table of the contraction scheme.
 
+    Attributes are refreshed incrementally: after an update, only the supernodes and superedges whose decontraction
+    has changed are evaluated again, along with the superedges incident to those supernodes. Attribute functions
+    must therefore be local: a supernode attribute may only depend on the decontraction of the supernode, and a
+    superedge attribute may only depend on the decontraction of the superedge and on its tail and head supernodes.
+    For instance, a supernode attribute derived from the degree or the neighbours of the supernode is not refreshed
+    when a superedge appears between two otherwise unchanged supernodes.
+
     Attributes
     ----------
     level : Optional[int]
@@ -34,13 +85,34 @@ class ContractionScheme(ABC):
     component_sets_table : Optional[CompTable]
         the component set table of this contraction scheme, that tracks the current state of the component sets
         recognized by the contraction scheme.
-    supernode_table : Dict[FrozenSet[ComponentSet], Supernode]
+    supernode_table : Dict[FrozenSet, Supernode]
         a dictionary that maps the bijection between sets of component sets and the supernodes of the contracted
-        decontractible graph produced by this contraction scheme.
+        decontractible graph produced by this contraction scheme. Each set of component sets is identified by the
+        frozen set of the keys of its component sets.
     update_quadruple : UpdateQuadruple
         a quadruple of four sets that tracks the changes in the supernodes and superedges of the contracted
         decontractible graph. Used as a buffer to store the changes to send to the immediate upper level of the
         multilevel graph the contraction scheme is part of.
+    parallel_attr_threshold : Optional[int]
+        the minimum number of supernodes, superedges or component sets to refresh for the attribute functions to be
+        evaluated in parallel through :class:`ParUtils`. If None, attribute functions are always evaluated serially.
+        Parallel evaluation only pays off for attribute functions that release the GIL, such as NetworkX or NumPy
+        based computations. It is set at construction and carried over by :meth:`clone`.
+    parallel_contraction_threshold : Optional[int]
+        the minimum number of edges of the graph to contract for the supernodes and superedges of the contracted
+        graph to be filled in parallel through :class:`ParUtils`, each supernode and each superedge being
+        independent of the others. If None, contractions are always performed serially. Like
+        ``parallel_attr_threshold``, it is set at construction and carried over by :meth:`clone`.
+    lazy_attr : bool
+        if True, the supernode and superedge attribute functions are not evaluated when the attributes are
+        refreshed, but the first time the attributes of each supernode or superedge are accessed. Attributes
+        that are never read are never computed. Deferred attributes are evaluated when read through the [] notation
+        or the ``get`` method of supernodes and superedges, while reading their ``attr`` dictionary directly
+        requires :meth:`force_update_attr` to be called first.
+        Like ``parallel_attr_threshold``, it is set at construction and carried over by :meth:`clone`.
+
+    Contraction schemes declare their instance attributes in ``__slots__``. Implementations are encouraged to do the
+    same for their own attributes, otherwise their instances fall back to having a ``__dict__``.
 
     Examples
     --------
@@ -69,8 +141,11 @@ class ContractionScheme(ABC):
     level: Optional[int]
     dec_graph: Optional[DecGraph]
     component_sets_table: Optional[CompTable]
-    supernode_table: Dict[FrozenSet[ComponentSet], Supernode]
+    supernode_table: Dict[FrozenSet, Supernode]
     update_quadruple: UpdateQuadruple
+    parallel_attr_threshold: Optional[int]
+    parallel_contraction_threshold: Optional[int]
+    lazy_attr: bool
 
     _supernode_id_counter: int
     _component_set_id_counter: int
@@ -78,24 +153,59 @@ class ContractionScheme(ABC):
     _superedge_attr_function: Callable[[Superedge], Dict[str, Any]]
     _c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]]
     _deleted_subnodes: Dict[Supernode, Set[Supernode]]
+    _dirty_supernodes: Set[Supernode]
+    _dirty_superedges: Set[Tuple[Any, Any]]
+    _dirty_c_sets: Set[ComponentSet]
+    _c_set_attr_cache: Dict[FrozenSet[Supernode], Dict[str, Any]]
+    _supernode_key_prefixes: Dict[Optional[int], str]
+    _has_supernode_attr: bool
+    _has_superedge_attr: bool
+    _has_c_set_attr: bool
+
+    __slots__ = ('level', 'dec_graph', 'component_sets_table', 'supernode_table', 'update_quadruple',
+                 '_supernode_id_counter', '_component_set_id_counter', '_supernode_attr_function',
+                 '_superedge_attr_function', '_c_set_attr_function', '_deleted_subnodes', '_dirty_supernodes',
+                 '_dirty_superedges', '_dirty_c_sets', '_c_set_attr_cache', '_supernode_key_prefixes', '_valid',
+                 '_has_supernode_attr', '_has_superedge_attr', '_has_c_set_attr', 'parallel_attr_threshold',
+                 'parallel_contraction_threshold', 'lazy_attr')
 
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
-                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None):
+                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
         """
         Initializes a contraction scheme based on the contraction function defined for this scheme.
 
         :param supernode_attr_function: a function that returns the attributes to assign to each supernode of this scheme
         :param superedge_attr_function: a function that returns the attributes to assign to each superedge of this scheme
         :param c_set_attr_function: a function that returns the attributes to assign to each component set of this scheme
+        :param parallel_attr_threshold: the minimum number of elements to refresh for the attribute functions to be
+            evaluated in parallel, or None to always evaluate them serially
+        :param parallel_contraction_threshold: the minimum number of edges of the graph to contract for the
+            contracted graph to be filled in parallel, or None to always contract serially
+        :param lazy_attr: if True, the supernode and superedge attribute functions are evaluated when the attributes
+            are first read instead of when they are refreshed
         """
         self._supernode_id_counter = 0
         self._component_set_id_counter = 0
-        self._supernode_attr_function = supernode_attr_function if supernode_attr_function else lambda x: {}
-        self._superedge_attr_function = superedge_attr_function if superedge_attr_function else lambda x: {}
-        self._c_set_attr_function = c_set_attr_function if c_set_attr_function else lambda x: {}
+        self._supernode_attr_function = supernode_attr_function if supernode_attr_function else _no_attr
+        self._superedge_attr_function = superedge_attr_function if superedge_attr_function else _no_attr
+        self._c_set_attr_function = c_set_attr_function if c_set_attr_function else _no_attr
+        self._has_supernode_attr = self._supernode_attr_function is not _no_attr
+        self._has_superedge_attr = self._superedge_attr_function is not _no_attr
+        self._has_c_set_attr = self._c_set_attr_function is not _no_attr
+        self.parallel_attr_threshold = parallel_attr_threshold
+        self.parallel_contraction_threshold = parallel_contraction_threshold
+        self.lazy_attr = lazy_attr
         self._deleted_subnodes = dict()
+        self._dirty_supernodes = set()
+        self._dirty_superedges = set()
+        self._dirty_c_sets = set()
+        self._c_set_attr_cache = dict()
+        self._supernode_key_prefixes = dict()
         self._valid = False
         self.level = None
         self.dec_graph = None
@@ -110,6 +220,8 @@ class ContractionScheme(ABC):
         The name should be unique among all the implementations of the ContractionScheme class.
         The name of the contraction scheme is used as part of the key for each supernode in the
         decontractible graph of this contraction scheme.
+        The name must not change during the lifetime of an instance, and may only depend on the construction
+        parameters of the scheme, since it is computed once and reused for all the supernode keys.
 
         :return: the name of the contraction scheme
         """
@@ -119,7 +231,8 @@ class ContractionScheme(ABC):
     def clone(self):
         """
         Instantiates and returns a new contraction scheme with the same starting attributes as this one,
-        such as attribute functions and others based on the implementation.
+        such as attribute functions, the ``parallel_attr_threshold``, ``parallel_contraction_threshold`` and
+        ``lazy_attr`` settings and others based on the implementation.
         The new contraction scheme does not preserve any information about the contraction sets or the
         decontractible graph of the clones one.
 
@@ -191,25 +304,95 @@ class ContractionScheme(ABC):
         """
         pass
 
+    def _update_added_nodes(self, nodes: Iterable[Supernode]):
+        """
+        Updates the structure of the decontractible graph of this contraction scheme according to the addition
+        of the given supernodes at the immediate lower level.
+
+        By default, each supernode is processed by ``_update_added_node``. Implementations can override this
+        method to process the whole batch at once.
+
+        :param nodes: the supernodes added to the lower level decontractible graph
+        """
+        update_added_node = self._update_added_node
+        for node in nodes:
+            update_added_node(node)
+
+    def _update_removed_nodes(self, nodes: Iterable[Supernode]):
+        """
+        Updates the structure of the decontractible graph of this contraction scheme according to the removal
+        of the given supernodes at the immediate lower level.
+
+        By default, each supernode is processed by ``_update_removed_node``. Implementations can override this
+        method to process the whole batch at once.
+
+        :param nodes: the supernodes removed from the lower level decontractible graph
+        """
+        update_removed_node = self._update_removed_node
+        for node in nodes:
+            update_removed_node(node)
+
+    def _update_added_edges(self, edges: Iterable[Superedge]):
+        """
+        Updates the structure of the decontractible graph of this contraction scheme according to the addition
+        of the given superedges at the immediate lower level.
+
+        By default, each superedge is processed by ``_update_added_edge``. Implementations can override this
+        method to process the whole batch at once.
+
+        :param edges: the superedges added to the lower level decontractible graph
+        """
+        update_added_edge = self._update_added_edge
+        for edge in edges:
+            update_added_edge(edge)
+
+    def _update_removed_edges(self, edges: Iterable[Superedge]):
+        """
+        Updates the structure of the decontractible graph of this contraction scheme according to the removal
+        of the given superedges at the immediate lower level.
+
+        By default, each superedge is processed by ``_update_removed_edge``. Implementations can override this
+        method to process the whole batch at once.
+
+        :param edges: the superedges removed from the lower level decontractible graph
+        """
+        update_removed_edge = self._update_removed_edge
+        for edge in edges:
+            update_removed_edge(edge)
+
     def update(self, update_quadruple: UpdateQuadruple) -> DecGraph:
         """
         Updates the structure of the decontractible graph of this contraction scheme according to the given
         update quadruple, indicating the changes in the supernodes and superedges of the decontractible graph at
         the immediate lower level.
 
+        Only the attributes of the supernodes, superedges and component sets affected by the given update
+        quadruple are refreshed after the structural update.
+
         :param update_quadruple: the update quadruple indicating the changes in the lower level decontractible graph
         :return: the updated decontractible graph of this contraction scheme
         """
-        for edge in update_quadruple.e_minus:
-            self._update_removed_edge(edge)
-        for node in update_quadruple.v_minus:
-            self._update_removed_node(node)
-        for node in update_quadruple.v_plus:
-            self._update_added_node(node)
-        for edge in update_quadruple.e_plus:
-            self._update_added_edge(edge)
+        self._c_set_attr_cache.clear()
+        mark_dirty_edge = self._mark_dirty_edge
+        e_minus = update_quadruple.e_minus
+        for edge in e_minus:
+            mark_dirty_edge(edge)
+
+        self._update_removed_edges(e_minus)
+        self._update_removed_nodes(update_quadruple.v_minus)
+        self._update_added_nodes(update_quadruple.v_plus)
+        self._update_added_edges(update_quadruple.e_plus)
 
         self._update_graph()
+
+        # Elements containing the lower level elements that have been added or modified are marked as dirty
+        # once the structure of the graph is up-to-date
+        for edge in update_quadruple.e_plus | update_quadruple.e_modified:
+            mark_dirty_edge(edge)
+        mark_dirty_node = self._mark_dirty_node
+        for node in update_quadruple.v_modified:
+            mark_dirty_node(node)
+
         self.update_attr()
         self._valid = True
 
@@ -235,10 +418,23 @@ class ContractionScheme(ABC):
         self._component_set_id_counter += 1
         return self._component_set_id_counter
 
+    def _get_supernode_key_prefix(self) -> str:
+        """
+        Returns the prefix shared by the keys of all the supernodes of this contraction scheme, made of the level
+        of the scheme, if any, and the name of the scheme.
+        Since the name of a contraction scheme is required not to change during the lifetime of the scheme,
+        the prefix is only computed once for each level the scheme is assigned to.
+
+        :return: the prefix of the supernode keys
+        """
+        prefix = self._supernode_key_prefixes.get(self.level)
+        if prefix is None:
+            prefix = (f"{self.level}_" if self.level else "") + f"{self.contraction_name()}_"
+            self._supernode_key_prefixes[self.level] = prefix
+        return prefix
+
     def _get_supernode_key(self):
-        return (str(self.level)+"_" if self.level else "") \
-            + self.contraction_name() + "_" \
-            + str(self._get_supernode_id())
+        return self._get_supernode_key_prefix() + str(self._get_supernode_id())
 
     def contract(self, dec_graph: DecGraph) -> DecGraph:
         """
@@ -248,12 +444,29 @@ class ContractionScheme(ABC):
         :param dec_graph: the decontractible graph to be contracted
         :return: the contracted decontractible graph
         """
+        self._c_set_attr_cache.clear()
         self.component_sets_table = self.contraction_function(dec_graph)
         self.dec_graph = self._make_dec_graph(self.component_sets_table, dec_graph)
-        self.update_attr()
+
+        # All the elements of the new graph are refreshed once at the initial build, unless there are no
+        # attributes to compute
+        if self._has_attr_functions():
+            self._dirty_supernodes = set(self.dec_graph.V.values())
+            self._dirty_superedges = set(self.dec_graph.E.keys())
+            self._dirty_c_sets = self.component_sets_table.get_all_c_sets()
+            self.update_attr()
+        self.update_quadruple.clear()
         self._valid = True
         return self.dec_graph
 
+    def _has_attr_functions(self) -> bool:
+        """
+        Returns whether at least one attribute function has been provided to this contraction scheme.
+
+        :return: True if the scheme has at least one attribute function, False otherwise
+        """
+        return self._has_supernode_attr or self._has_superedge_attr or self._has_c_set_attr
+
     def is_valid(self):
         """
         Returns whether the decontractible graph of this contraction scheme is valid, that is, it has been
@@ -270,6 +483,24 @@ class ContractionScheme(ABC):
         """
         self._valid = False
 
+    @staticmethod
+    def _canonical_key(c_sets: Collection[ComponentSet]) -> FrozenSet:
+        """
+        Returns the key identifying the given set of component sets in the supernode table, that is, the frozen
+        set of the keys of the component sets.
+        Hashing and comparing a frozen set of keys is cheaper than doing the same on a frozen set of component sets,
+        which requires a call to the hash function of each component set, and it does not require the keys to be
+        orderable.
+        Sets made of a single component set, the only case for partitioning schemes, skip the generator.
+
+        :param c_sets: the set of component sets
+        :return: the key of the set of component sets in the supernode table
+        """
+        if len(c_sets) == 1:
+            for c_set in c_sets:
+                return frozenset((c_set.key,))
+        return frozenset(c_set.key for c_set in c_sets)
+
     def _make_dec_graph(self, dec_table: CompTable, dec_graph: DecGraph) -> DecGraph:
         """
         Constructs a decontractible graph from the given decontractible graph
@@ -280,47 +511,215 @@ class ContractionScheme(ABC):
         """
         self.supernode_table = dict()
         contracted_graph = DecGraph()
+        key_prefix = self._get_supernode_key_prefix()
+
+        # Supernodes are laid out in a list, and each node of the given graph is mapped, by its key, to the index
+        # of its supernode in the list, so that edges can be dispatched by reading two integers.
+        supernodes: List[Supernode] = []
+        supernode_indices: Dict[FrozenSet, int] = dict()
+        node_supernode_index: Dict[Any, int] = dict()
 
         # For each node, we assign it to a supernode corresponding to the set of component sets
         for node, set_of_c_sets in dec_table.items():
-            f_component_sets = frozenset(set_of_c_sets)
-            if f_component_sets not in self.supernode_table:
+            supernode_key = self._canonical_key(set_of_c_sets)
+            index = supernode_indices.get(supernode_key)
+            if index is None:
                 supernode = \
-                    Supernode(key=self._get_supernode_key(),
+                    Supernode(key=key_prefix + str(self._get_supernode_id()),
                               level=self.level,
-                              component_sets=f_component_sets)
+                              component_sets=frozenset(set_of_c_sets))
 
-                self.supernode_table[f_component_sets] = supernode
+                index = supernode_indices[supernode_key] = len(supernodes)
+                supernodes.append(supernode)
+                self.supernode_table[supernode_key] = supernode
                 contracted_graph.add_node(supernode)
             else:
-                supernode = self.supernode_table[f_component_sets]
+                supernode = supernodes[index]
 
             supernode.add_node(node)
             node.supernode = supernode
-
-        # For each edge, we assign it to a superedge if the tail and head are in different supernodes,
-        # otherwise we assign it to the supernode containing both tail and head.
-        for edge in dec_graph.edges():
-            tail = edge.tail
-            head = edge.head
-            if tail.supernode != head.supernode:
-                contracted_graph.add_edge(Superedge(tail.supernode, head.supernode, level=self.level))
-                contracted_graph.E[(tail.supernode.key, head.supernode.key)].add_edge(edge)
-            else:
-                tail.supernode.add_edge(edge)
+            node_supernode_index[node.key] = index
+
+        # Edges are grouped by the pair of supernode indices of their tail and head, so that each superedge
+        # is created only once for the whole group of edges it represents.
+        edges = list(dec_graph.E.values())
+        tail_indices = [node_supernode_index[edge.tail.key] for edge in edges]
+        head_indices = [node_supernode_index[edge.head.key] for edge in edges]
+        intra_groups, inter_groups = _partition_edges(tail_indices, head_indices, len(supernodes))
+
+        # Edges having tail and head in the same supernode are assigned to that supernode, while the other edges
+        # are assigned to the superedge between the supernodes of their tail and head.
+        def fill_supernode(item: Tuple[int, List[int]]):
+            index, group = item
+            supernode = supernodes[index]
+            for position in group:
+                supernode.add_edge(edges[position])
+
+        def build_superedge(item: Tuple[int, List[int]]) -> Superedge:
+            pair, group = item
+            tail_index, head_index = divmod(pair, len(supernodes))
+            superedge = Superedge(supernodes[tail_index], supernodes[head_index], level=self.level)
+            for position in group:
+                superedge.add_edge(edges[position])
+            return superedge
+
+        # Each group only touches its own supernode or superedge, so groups can be processed in parallel, while
+        # superedges are always added to the contracted graph serially
+        if self.parallel_contraction_threshold is not None and len(edges) >= self.parallel_contraction_threshold:
+            ParUtils.par_map(fill_supernode, list(intra_groups.items()))
+            superedges = ParUtils.par_map(build_superedge, list(inter_groups.items()))
+        else:
+            for item in intra_groups.items():
+                fill_supernode(item)
+            superedges = map(build_superedge, inter_groups.items())
+        for superedge in superedges:
+            contracted_graph.add_edge(superedge)
 
         return contracted_graph
 
     def update_attr(self):
         """
-        Updates the attributes of the supernodes, superedges and component sets of this contraction scheme.
+        Updates the attributes of the supernodes, superedges and component sets of this contraction scheme that
+        have been marked as dirty since the last update.
+        Superedges incident to a dirty supernode are refreshed as well, since their attributes may depend on the
+        attributes of their tail and head.
+        Refreshed supernodes and superedges are tracked as modified in the update quadruple.
+        If ``lazy_attr`` is set, the evaluation of the supernode and superedge attribute functions is deferred
+        until the attributes are accessed.
+
+        Since dirty elements are tracked as sets, each element is refreshed at most once per call, however many
+        times it has been marked as dirty since the previous call.
+        """
+        if not (self._dirty_supernodes or self._dirty_superedges or self._dirty_c_sets):
+            return
+
+        graph = self.dec_graph.graph(ref=True)
+        V = self.dec_graph.V
+        E = self.dec_graph.E
+
+        # Dirty elements that are no longer part of the graph are discarded
+        supernodes = [supernode for supernode in self._dirty_supernodes if V.get(supernode.key) is supernode]
+        for supernode in supernodes:
+            for head_key in graph.successors(supernode.key):
+                self._dirty_superedges.add((supernode.key, head_key))
+            for tail_key in graph.predecessors(supernode.key):
+                self._dirty_superedges.add((tail_key, supernode.key))
+        # Dirty superedges are tracked by key, so that a superedge removed and recreated with the same endpoints is
+        # resolved to the one currently in the graph
+        superedges = [E[key] for key in self._dirty_superedges if key in E]
+
+        c_sets = [c_set for c_set in self._dirty_c_sets if self.component_sets_table.has_set(c_set)]
+
+        # Missing attribute functions are not evaluated at all, while attribute functions may be evaluated in
+        # parallel, with the results always assigned serially
+        if self._has_supernode_attr:
+            if self.lazy_attr:
+                for supernode in supernodes:
+                    supernode.defer_update(self._supernode_attr_function)
+            else:
+                for supernode, attr in zip(supernodes,
+                                           self._map_attr_function(self._supernode_attr_function, supernodes)):
+                    supernode.update(**attr)
+
+        if self._has_superedge_attr:
+            if self.lazy_attr:
+                for superedge in superedges:
+                    superedge.defer_update(self._superedge_attr_function)
+            else:
+                for superedge, attr in zip(superedges,
+                                           self._map_attr_function(self._superedge_attr_function, superedges)):
+                    superedge.update(**attr)
+
+        if self._has_c_set_attr:
+            for c_set, attr in zip(c_sets, self._map_attr_function(lambda c: self._c_set_attr(set(c)), c_sets)):
+                c_set.update(**attr)
+
+        for supernode in supernodes:
+            self.update_quadruple.add_v_modified(supernode)
+        for superedge in superedges:
+            self.update_quadruple.add_e_modified(superedge)
+
+        self._dirty_supernodes.clear()
+        self._dirty_superedges.clear()
+        self._dirty_c_sets.clear()
+        self._c_set_attr_cache.clear()
+
+    def force_update_attr(self):
         """
-        for supernode in self.dec_graph.nodes():
-            supernode.update(**self._supernode_attr_function(supernode))
-        for superedge in self.dec_graph.edges():
-            superedge.update(**self._superedge_attr_function(superedge))
-        for c_set in self.component_sets_table.get_all_c_sets():
-            c_set.update(**self._c_set_attr_function(set(c_set)))
+        Evaluates the attribute functions of all the supernodes and superedges of this contraction scheme whose
+        attribute update has been deferred, as happens when ``lazy_attr`` is set.
+        This is required before reading the ``attr`` dictionaries of supernodes and superedges directly, and is
+        useful before reading all the attributes at once, e.g. before serializing the contracted graph.
+        """
+        self.update_attr()
+        for supernode in self.dec_graph.V.values():
+            supernode.apply_deferred_update()
+        for superedge in self.dec_graph.E.values():
+            superedge.apply_deferred_update()
+
+    def _c_set_attr(self, c_set: Set[Supernode]) -> Dict[str, Any]:
+        """
+        Returns the attributes for the component set made of the given nodes, according to the component set
+        attribute function of this scheme.
+        Results are memoized by set of nodes until the end of the next ``update_attr`` call, so that the
+        component sets created during a contraction or an update are not evaluated again when their attributes
+        are refreshed. Since the lower level does not change in the meantime, memoized results cannot be stale.
+
+        This method should be used by the implementations of this class in place of the component set attribute
+        function.
+
+        :param c_set: the set of nodes of the component set
+        :return: the attributes to assign to the component set
+        """
+        if not self._has_c_set_attr:
+            return {}
+        key = frozenset(c_set)
+        attr = self._c_set_attr_cache.get(key)
+        if attr is None:
+            attr = self._c_set_attr_function(c_set)
+            self._c_set_attr_cache[key] = attr
+        return attr
+
+    def _map_attr_function(self, attr_function: Callable[[Any], Dict[str, Any]], elements: List) -> Iterable:
+        """
+        Returns the results of the given attribute function applied to each of the given elements, in order.
+        The function is evaluated in parallel if the number of elements reaches the ``parallel_attr_threshold``
+        of this scheme.
+
+        :param attr_function: the attribute function to apply
+        :param elements: the list of elements
+        :return: the attributes computed for each element
+        """
+        if elements and self.parallel_attr_threshold is not None and len(elements) >= self.parallel_attr_threshold:
+            return ParUtils.par_map(attr_function, elements)
+        return map(attr_function, elements)
+
+    def _mark_dirty_node(self, node: Supernode):
+        """
+        Marks as dirty the supernode containing the given node of the immediate lower level, along with the
+        component sets the node is part of.
+
+        :param node: the node of the lower level decontractible graph
+        """
+        if node.supernode is not None:
+            self._dirty_supernodes.add(node.supernode)
+        if node in self.component_sets_table:
+            self._dirty_c_sets.update(self.component_sets_table[node])
+
+    def _mark_dirty_edge(self, edge: Superedge):
+        """
+        Marks as dirty the supernode or superedge containing the given edge of the immediate lower level.
+
+        :param edge: the edge of the lower level decontractible graph
+        """
+        tail_supernode = edge.tail.supernode
+        head_supernode = edge.head.supernode
+        if tail_supernode is None or head_supernode is None:
+            return
+        if tail_supernode == head_supernode:
+            self._dirty_supernodes.add(tail_supernode)
+        else:
+            self._dirty_superedges.add((tail_supernode.key, head_supernode.key))
 
     def _add_edge_in_superedge(self, tail_key: Any, head_key: Any, edge: Superedge):
         """
@@ -332,12 +731,14 @@ class ContractionScheme(ABC):
         :param head_key: the key of the head supernode of the superedge
         :param edge: the edge to add
         """
-        if (tail_key, head_key) not in self.dec_graph.E:
-            new_superedge = Superedge(self.dec_graph.V[tail_key], self.dec_graph.V[head_key], level=self.level)
-            self.dec_graph.add_edge(new_superedge)
-            self.update_quadruple.add_e_plus(new_superedge)
+        superedge = self.dec_graph.E.get((tail_key, head_key))
+        if superedge is None:
+            superedge = Superedge(self.dec_graph.V[tail_key], self.dec_graph.V[head_key], level=self.level)
+            self.dec_graph.add_edge(superedge)
+            self.update_quadruple.add_e_plus(superedge)
 
-        self.dec_graph.E[(tail_key, head_key)].add_edge(edge)
+        superedge.add_edge(edge)
+        self._dirty_superedges.add((tail_key, head_key))
 
     def _remove_edge_in_superedge(self, tail_key: Any, head_key: Any, edge: Superedge):
         """
@@ -352,6 +753,7 @@ class ContractionScheme(ABC):
         """
         superedge = self.dec_graph.E[(tail_key, head_key)]
         superedge.remove_edge(edge)
+        self._dirty_superedges.add((tail_key, head_key))
 
         if not superedge.dec:
             self.dec_graph.remove_edge(superedge)
@@ -371,7 +773,8 @@ class ContractionScheme(ABC):
                               component_sets=component_sets)
         self.dec_graph.add_node(supernode)
         self.update_quadruple.add_v_plus(supernode)
-        self.supernode_table[component_sets] = supernode
+        self.supernode_table[self._canonical_key(component_sets)] = supernode
+        self._dirty_supernodes.add(supernode)
         return supernode
 
     def _remove_supernode(self, supernode: Supernode):
@@ -383,8 +786,7 @@ class ContractionScheme(ABC):
         """
         self.dec_graph.remove_node(supernode)
         self.update_quadruple.add_v_minus(supernode)
-        if supernode.component_sets in self.supernode_table:
-            del self.supernode_table[supernode.component_sets]
+        self.supernode_table.pop(self._canonical_key(supernode.component_sets), None)
 
     def _update_graph(self):
         """
@@ -392,15 +794,19 @@ class ContractionScheme(ABC):
         in the component sets tracked by the component sets table.
         """
         old_supernodes: Dict[Supernode, Supernode] = dict()
-        decontraction = self.dec_graph.complete_decontraction()
+        # The incident edges of the modified nodes are collected before any edge is moved
+        incident_edges = self._lower_level_incident_edges(self.component_sets_table.modified)
 
         # Modified nodes are the nodes that have changed their component sets
         for node in self.component_sets_table.modified:
-            c_sets_of_node = frozenset(self.component_sets_table[node])
+            c_sets_of_node = self.component_sets_table[node]
+            supernode_key = self._canonical_key(c_sets_of_node)
+            self._dirty_c_sets.update(c_sets_of_node)
 
             # If set of component sets does not represent any existing supernode, we add a new supernode
-            if c_sets_of_node not in self.supernode_table:
-                self._add_supernode(c_sets_of_node)
+            new_supernode = self.supernode_table.get(supernode_key)
+            if new_supernode is None:
+                new_supernode = self._add_supernode(frozenset(c_sets_of_node))
 
             # The old supernode of the node is stored to update the edges later
             old_supernodes[node] = node.supernode
@@ -408,14 +814,16 @@ class ContractionScheme(ABC):
             self._deleted_subnodes.setdefault(node.supernode, set()).add(node)
 
             # The node is assigned to the new supernode
-            node.supernode = self.supernode_table[c_sets_of_node]
+            node.supernode = new_supernode
             node.supernode.dec.add_node(node)
+            self._dirty_supernodes.add(node.supernode)
 
         # Edges at lower level are moved among superedges and supernodes according to the changes in the component
         # sets table
 
         for b in self.component_sets_table.modified:
-            for edge in decontraction.in_edges(b):
+            in_edges, out_edges = incident_edges[b.key]
+            for edge in in_edges:
                 if edge.tail not in old_supernodes:
 
                     if edge.tail.supernode == old_supernodes[b]:
@@ -428,7 +836,7 @@ class ContractionScheme(ABC):
                     else:
                         self._add_edge_in_superedge(edge.tail.supernode.key, b.supernode.key, edge)
 
-            for edge in decontraction.out_edges(b):
+            for edge in out_edges:
                 if edge.head in old_supernodes:
 
                     if old_supernodes[b] == old_supernodes[edge.head]:
@@ -456,13 +864,44 @@ class ContractionScheme(ABC):
         for supernode, node_set in self._deleted_subnodes.items():
             for node in node_set:
                 supernode.dec.remove_node(node)
+            self._dirty_supernodes.add(supernode)
             # The supernodes that have no longer sub-nodes are removed
-            if not supernode.dec.nodes():
+            if not supernode.dec.V:
                 self._remove_supernode(supernode)
 
         self._deleted_subnodes.clear()
         self.component_sets_table.modified.clear()
 
+    def _lower_level_incident_edges(self, nodes: Iterable[Supernode]) \
+            -> Dict[Any, Tuple[Set[Superedge], Set[Superedge]]]:
+        """
+        Returns the edges of the immediate lower level entering and leaving each of the given nodes.
+        Edges are looked up in the supernodes containing the nodes and in the superedges incident to those
+        supernodes, so that only their neighbourhood is visited, instead of building the complete decontraction
+        of the graph of this contraction scheme.
+
+        :param nodes: the nodes of the immediate lower level
+        :return: a dictionary mapping the key of each node to the set of edges entering the node and the set of
+            edges leaving the node
+        """
+        incident_edges = {node.key: (set(), set()) for node in nodes}
+        graph = self.dec_graph.graph(ref=True)
+        E = self.dec_graph.E
+
+        for supernode in {node.supernode.key: node.supernode for node in nodes}.values():
+            edge_sets = [supernode.dec.E.values()]
+            edge_sets.extend(E[(tail_key, supernode.key)].dec for tail_key in graph.predecessors(supernode.key))
+            edge_sets.extend(E[(supernode.key, head_key)].dec for head_key in graph.successors(supernode.key))
+            for edge_set in edge_sets:
+                for edge in edge_set:
+                    head_edges = incident_edges.get(edge.head.key)
+                    if head_edges is not None:
+                        head_edges[0].add(edge)
+                    tail_edges = incident_edges.get(edge.tail.key)
+                    if tail_edges is not None:
+                        tail_edges[1].add(edge)
+        return incident_edges
+
     def __str__(self):
         return f"{self.contraction_name()}"
 
@@ -23,11 +23,21 @@ class DecontractionEdgeBasedContractionScheme(EdgeBasedContractionScheme, ABC):
 
     _decontracted_graph: Optional[DecGraph]
 
+    __slots__ = ('_decontracted_graph',)
+
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
-                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None):
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
         self._decontracted_graph = None  # Used to store the current complete decontraction during subsequent updates
 
     @abstractmethod
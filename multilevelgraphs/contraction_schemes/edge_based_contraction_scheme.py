@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, Set
+from typing import Callable, Dict, Any, Set, Optional
 
 from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge
 from multilevelgraphs.contraction_schemes import ContractionScheme, CompTable, ComponentSet
@@ -23,11 +23,21 @@ class EdgeBasedContractionScheme(ContractionScheme, ABC):
     specific contraction scheme.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
-                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None):
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
 
     @abstractmethod
     def contraction_name(self) -> str:
@@ -44,7 +54,7 @@ class EdgeBasedContractionScheme(ContractionScheme, ABC):
     def _update_added_node(self, node: Supernode):
         # A new dummy supernode is created for the new node, in order to provide a temporary supernode for the new node
         # during following update procedures before the _update_graph procedure.
-        new_c_set = ComponentSet(self._get_component_set_id(), {node}, **(self._c_set_attr_function({node})))
+        new_c_set = ComponentSet(self._get_component_set_id(), {node}, **(self._c_set_attr({node})))
         self.component_sets_table.add_set(new_c_set)
         f_c_set = frozenset(self.component_sets_table[node])
         dummy_supernode = Supernode(self._get_supernode_id(), level=self.level, component_sets=f_c_set)
@@ -18,11 +18,18 @@ class UpdateQuadruple:
 
     The update quadruple is managed in order to maintain itself minimal, that is, ``v_plus`` and ``v_minus``
     are disjoint and ``e_plus`` and ``e_minus`` are disjoint.
+
+    Alongside the four sets, the update quadruple tracks the supernodes and superedges that are still in the
+    decontractible graph but whose decontraction or attributes have been modified (``v_modified`` and
+    ``e_modified``), so that the immediate upper level can refresh the attributes of the elements containing them.
+    These two sets are disjoint from the four sets above and are not considered when comparing update quadruples.
     """
     _v_plus: Set[Supernode]
     _v_minus: Set[Supernode]
     _e_plus: Set[Superedge]
     _e_minus: Set[Superedge]
+    _v_modified: Set[Supernode]
+    _e_modified: Set[Superedge]
 
     def __init__(self,
                  v_plus: Iterable[Supernode] = None,
@@ -33,6 +40,8 @@ class UpdateQuadruple:
         self._v_minus = set(v_minus) if v_minus else set()
         self._e_plus = set(e_plus) if e_plus else set()
         self._e_minus = set(e_minus) if e_minus else set()
+        self._v_modified = set()
+        self._e_modified = set()
 
     @property
     def v_plus(self) -> Set[Supernode]:
@@ -66,6 +75,22 @@ class UpdateQuadruple:
         """
         return set(self._e_minus)
 
+    @property
+    def v_modified(self) -> Set[Supernode]:
+        """
+        Returns a copy of the set of supernodes that have been modified.
+        :return: a copy of the set of supernodes that have been modified
+        """
+        return set(self._v_modified)
+
+    @property
+    def e_modified(self) -> Set[Superedge]:
+        """
+        Returns a copy of the set of superedges that have been modified.
+        :return: a copy of the set of superedges that have been modified
+        """
+        return set(self._e_modified)
+
     def add_v_plus(self, supernode: Supernode):
         """
         Adds a supernode to the set of supernodes that have been added.
@@ -85,6 +110,7 @@ class UpdateQuadruple:
 
         :param supernode: the supernode to add
         """
+        self._v_modified.discard(supernode)
         if supernode not in self._v_plus:
             self._v_minus.add(supernode)
         else:
@@ -109,18 +135,40 @@ class UpdateQuadruple:
 
         :param superedge: the superedge to add
         """
+        self._e_modified.discard(superedge)
         if superedge not in self._e_plus:
             self._e_minus.add(superedge)
         else:
             self._e_plus.remove(superedge)
 
+    def add_v_modified(self, supernode: Supernode):
+        """
+        Adds a supernode to the set of supernodes that have been modified.
+        If the supernode is in the set of supernodes that have been added, nothing happens.
+
+        :param supernode: the supernode to add
+        """
+        if supernode not in self._v_plus:
+            self._v_modified.add(supernode)
+
+    def add_e_modified(self, superedge: Superedge):
+        """
+        Adds a superedge to the set of superedges that have been modified.
+        If the superedge is in the set of superedges that have been added, nothing happens.
+
+        :param superedge: the superedge to add
+        """
+        if superedge not in self._e_plus:
+            self._e_modified.add(superedge)
+
     def has_updates(self) -> bool:
         """
         Returns True if there are any supernodes or superedges in any of the sets of the update quadruple,
-        False otherwise.
+        including the sets of modified supernodes and superedges, False otherwise.
         :return: True if there are any supernodes or superedges in the update quadruple
         """
-        return bool(self._v_plus or self._v_minus or self._e_plus or self._e_minus)
+        return bool(self._v_plus or self._v_minus or self._e_plus or self._e_minus or self._v_modified
+                    or self._e_modified)
 
     def clear(self):
         """
@@ -130,6 +178,8 @@ class UpdateQuadruple:
         self._v_minus.clear()
         self._e_plus.clear()
         self._e_minus.clear()
+        self._v_modified.clear()
+        self._e_modified.clear()
 
     def __str__(self):
         return f'UpdateQuadruple(v_plus={self._v_plus}, ' \
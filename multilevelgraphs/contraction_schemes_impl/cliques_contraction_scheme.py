@@ -1,4 +1,4 @@
-from typing import Callable, Set, Dict, Any, List
+from typing import Callable, Set, Dict, Any, List, Optional
 import networkx as nx
 from multilevelgraphs.contraction_schemes import EdgeBasedContractionScheme, ComponentSet, CompTable
 from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge, maximal_cliques
@@ -27,11 +27,16 @@ class CliquesContractionScheme(EdgeBasedContractionScheme):
     """
     _reciprocal: bool
 
+    __slots__ = ('_reciprocal',)
+
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
                  c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
-                 reciprocal: bool = False):
+                 reciprocal: bool = False,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
         """
             Initializes a contraction scheme based on the contraction function by cliques.
             In a decontractible (directed) graph, a clique is a subset of nodes of a graph such that every two distinct
@@ -45,8 +50,19 @@ class CliquesContractionScheme(EdgeBasedContractionScheme):
             :param superedge_attr_function: a function that returns the attributes to assign to each superedge of this scheme
             :param c_set_attr_function: a function that returns the attributes to assign to each component set of this scheme
             :param reciprocal: if True, two nodes are considered adjacent if there is an edge between them in both directions
+            :param parallel_attr_threshold: the minimum number of elements to refresh for the attribute functions to be
+                evaluated in parallel, or None to always evaluate them serially
+            :param parallel_contraction_threshold: the minimum number of edges of the graph to contract for the
+                contracted graph to be filled in parallel, or None to always contract serially
+            :param lazy_attr: if True, the supernode and superedge attribute functions are evaluated when the attributes
+                are first read instead of when they are refreshed
         """
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
         self._reciprocal = reciprocal
 
     def contraction_name(self) -> str:
@@ -56,14 +72,17 @@ class CliquesContractionScheme(EdgeBasedContractionScheme):
         return CliquesContractionScheme(self._supernode_attr_function,
                                         self._superedge_attr_function,
                                         self._c_set_attr_function,
-                                        self._reciprocal)
+                                        self._reciprocal,
+                                        parallel_attr_threshold=self.parallel_attr_threshold,
+                                        parallel_contraction_threshold=self.parallel_contraction_threshold,
+                                        lazy_attr=self.lazy_attr)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
         cliques = maximal_cliques(dec_graph, self._reciprocal)
 
         return CompTable([ComponentSet(self._get_component_set_id(),
                                        clique,
-                                       **(self._c_set_attr_function(clique))) for clique in cliques])
+                                       **(self._c_set_attr(clique))) for clique in cliques])
 
     def _update_added_edge(self, edge: Superedge):
         u = edge.tail.supernode
@@ -28,11 +28,16 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
     """
     _maximal: bool
 
+    __slots__ = ('_maximal',)
+
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
                  c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
-                 maximal: bool = True):
+                 maximal: bool = True,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
         """
         Initializes a contraction scheme based on the contraction function by simple cycles.
         A simple cycle, or elementary circuit, is a closed path where no node appears twice.
@@ -44,8 +49,19 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
         :param superedge_attr_function: a function that returns the attributes to assign to each superedge of this scheme
         :param c_set_attr_function: a function that returns the attributes to assign to each component set of this scheme
         :param maximal: if True, only maximal simple cycles are considered
+        :param parallel_attr_threshold: the minimum number of elements to refresh for the attribute functions to be
+            evaluated in parallel, or None to always evaluate them serially
+        :param parallel_contraction_threshold: the minimum number of edges of the graph to contract for the
+            contracted graph to be filled in parallel, or None to always contract serially
+        :param lazy_attr: if True, the supernode and superedge attribute functions are evaluated when the attributes
+            are first read instead of when they are refreshed
         """
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
         self._maximal = maximal
 
     def contraction_name(self) -> str:
@@ -55,7 +71,10 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
         return CyclesContractionScheme(self._supernode_attr_function,
                                        self._superedge_attr_function,
                                        self._c_set_attr_function,
-                                       self._maximal)
+                                       self._maximal,
+                                       parallel_attr_threshold=self.parallel_attr_threshold,
+                                       parallel_contraction_threshold=self.parallel_contraction_threshold,
+                                       lazy_attr=self.lazy_attr)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
         comp_sets = self._component_set_from_cycles(simple_cycles(dec_graph))
@@ -72,7 +91,7 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
             if node not in comp_table:
                 comp_table.add_set(ComponentSet(self._get_component_set_id(),
                                                 {node},
-                                                **(self._c_set_attr_function({node}))))
+                                                **(self._c_set_attr({node}))))
 
         comp_table.modified.clear()
 
@@ -81,7 +100,7 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
     def _component_set_from_cycles(self, cycles: Generator[Tuple[Supernode, ...], None, None]) -> Generator[ComponentSet, None, None]:
         for cycle in cycles:
             cycle_set = set(cycle)
-            yield ComponentSet(self._get_component_set_id(), cycle_set, **(self._c_set_attr_function(cycle_set)))
+            yield ComponentSet(self._get_component_set_id(), cycle_set, **(self._c_set_attr(cycle_set)))
 
     def _update_added_edge(self, edge: Superedge):
         u = edge.tail.supernode
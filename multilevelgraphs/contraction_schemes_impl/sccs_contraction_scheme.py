@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Any, Set
+from typing import Callable, Dict, Any, Set, Iterable, Optional
 import networkx as nx
 
 from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge
@@ -16,10 +16,15 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
     A strongly connected component (SCC) of a decontractible (directed) graph is the node set of a maximal subgraph
     in which there is a path between every pair of nodes.
     """
+    __slots__ = ()
+
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
-                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None):
+                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
         """
         Initializes a contraction scheme based on the contraction function by strongly connected components.
         A strongly connected component (SCC) of a decontractible (directed) graph is the node set of a maximal subgraph
@@ -31,8 +36,19 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
         :param supernode_attr_function: a function that returns the attributes to assign to each supernode of this scheme
         :param superedge_attr_function: a function that returns the attributes to assign to each superedge of this scheme
         :param c_set_attr_function: a function that returns the attributes to assign to each component set of this scheme
+        :param parallel_attr_threshold: the minimum number of elements to refresh for the attribute functions to be
+            evaluated in parallel, or None to always evaluate them serially
+        :param parallel_contraction_threshold: the minimum number of edges of the graph to contract for the
+            contracted graph to be filled in parallel, or None to always contract serially
+        :param lazy_attr: if True, the supernode and superedge attribute functions are evaluated when the attributes
+            are first read instead of when they are refreshed
         """
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
 
     def contraction_name(self) -> str:
         return "scc"
@@ -40,13 +56,16 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
     def clone(self):
         return SCCsContractionScheme(self._supernode_attr_function,
                                      self._superedge_attr_function,
-                                     self._c_set_attr_function)
+                                     self._c_set_attr_function,
+                                     parallel_attr_threshold=self.parallel_attr_threshold,
+                                     parallel_contraction_threshold=self.parallel_contraction_threshold,
+                                     lazy_attr=self.lazy_attr)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
         sccs = strongly_connected_components(dec_graph)
         return CompTable([ComponentSet(self._get_component_set_id(),
                                        set(scc),
-                                       **(self._c_set_attr_function(set(scc)))) for scc in sccs])
+                                       **(self._c_set_attr(set(scc)))) for scc in sccs])
 
     def _update_added_edge(self, edge: Superedge):
         u = edge.tail.supernode
@@ -64,7 +83,7 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
                     new_set = set.union(*[supernode.dec.nodes() for supernode in reach_supernodes])
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                    new_set,
-                                                                   **(self._c_set_attr_function(new_set))))
+                                                                   **(self._c_set_attr(new_set))))
                     self._update_graph() # Updates graph structure for further updates
 
     def _reach_visit(self, start_node: Supernode, target_node: Supernode) -> Set[Supernode]:
@@ -77,7 +96,7 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
         :return: the set of supernodes that are both reachable from the start node and can reach the target node
         """
         can_reach_target_table = {target_node.key: True}
-        self._reach_dfs(self.dec_graph.graph(), start_node.key, can_reach_target_table)
+        self._reach_dfs(self.dec_graph.graph(ref=True), start_node.key, can_reach_target_table)
         return {self.dec_graph.V[node_key] for node_key, can_reach in can_reach_target_table.items() if can_reach}
 
     def _reach_dfs(self, graph: nx.DiGraph, u: Any, can_reach_target_table: Dict[Supernode, bool]):
@@ -103,14 +122,41 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
                 self.component_sets_table.remove_set(next(iter(u.component_sets)))
                 self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                inner_reachable_nodes,
-                                                               **(self._c_set_attr_function(inner_reachable_nodes))))
+                                                               **(self._c_set_attr(inner_reachable_nodes))))
                 for scc in sccs_in_h:
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                    set(scc),
-                                                                   **(self._c_set_attr_function(set(scc)))))
+                                                                   **(self._c_set_attr(set(scc)))))
                 self._update_graph() # Updates graph structure for furthers updates
 
+    def _update_removed_edges(self, edges: Iterable[Superedge]):
+        # Removing edges can only split the SCCs containing them. Hence, all the edges are removed first,
+        # then the SCCs of each supernode that lost an inner edge are computed once for the whole batch.
+        split_candidates = dict()
+        for edge in edges:
+            u = edge.tail.supernode
+            v = edge.head.supernode
+
+            if u != v:
+                self._remove_edge_in_superedge(u.key, v.key, edge)
+            else:
+                u.remove_edge(edge)
+                split_candidates[u.key] = u
+
+        split = False
+        for u in split_candidates.values():
+            sccs = list(strongly_connected_components(u.dec))
+            if len(sccs) > 1:
+                split = True
+                self.component_sets_table.remove_set(next(iter(u.component_sets)))
+                for scc in sccs:
+                    self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
+                                                                   set(scc),
+                                                                   **(self._c_set_attr(set(scc)))))
+        if split:
+            self._update_graph()
+
     @staticmethod
     def _reachable_nodes_from(dec_graph: DecGraph, node: Supernode) -> Set[Supernode]:
-        descendants = nx.descendants(dec_graph.graph(), node.key)
+        descendants = nx.descendants(dec_graph.graph(ref=True), node.key)
         return {dec_graph.V[key] for key in descendants}.union({node})
@@ -25,11 +25,16 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
     """
     _reciprocal: bool
 
+    __slots__ = ('_reciprocal',)
+
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
                  c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
-                 reciprocal: bool = False):
+                 reciprocal: bool = False,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
         """
             Initializes a contraction scheme based on the contraction function by stars.
             In a decontractible (directed) graph, a star is a complete bipartite graph with sets of cardinality
@@ -44,8 +49,19 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
             :param superedge_attr_function: a function that returns the attributes to assign to each superedge of this scheme
             :param c_set_attr_function: a function that returns the attributes to assign to each component set of this scheme
             :param reciprocal: if True, two nodes are considered adjacent if there is an edge between them in both directions
+            :param parallel_attr_threshold: the minimum number of elements to refresh for the attribute functions to be
+                evaluated in parallel, or None to always evaluate them serially
+            :param parallel_contraction_threshold: the minimum number of edges of the graph to contract for the
+                contracted graph to be filled in parallel, or None to always contract serially
+            :param lazy_attr: if True, the supernode and superedge attribute functions are evaluated when the attributes
+                are first read instead of when they are refreshed
         """
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
         self._reciprocal = reciprocal
 
     def contraction_name(self) -> str:
@@ -55,19 +71,22 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
         return StarsContractionScheme(self._supernode_attr_function,
                                       self._superedge_attr_function,
                                       self._c_set_attr_function,
-                                      self._reciprocal)
+                                      self._reciprocal,
+                                      parallel_attr_threshold=self.parallel_attr_threshold,
+                                      parallel_contraction_threshold=self.parallel_contraction_threshold,
+                                      lazy_attr=self.lazy_attr)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
         stars = self._star_sets(dec_graph)
         comp_table = CompTable([ComponentSet(self._get_component_set_id(),
                                              star,
-                                             **(self._c_set_attr_function(star))) for star in stars])
+                                             **(self._c_set_attr(star))) for star in stars])
 
         for node in dec_graph.V.values():
             if node not in comp_table:
                 comp_table.add_set(ComponentSet(self._get_component_set_id(),
                                                 {node},
-                                                **(self._c_set_attr_function({node}))))
+                                                **(self._c_set_attr({node}))))
 
         comp_table.modified.clear()
 
@@ -141,10 +160,10 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
                     self.component_sets_table.remove_set(set_to_split)
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                    {node},
-                                                                   **(self._c_set_attr_function({node}))))
+                                                                   **(self._c_set_attr({node}))))
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                    set_to_split - {node},
-                                                                   **(self._c_set_attr_function(set_to_split - {node})))
+                                                                   **(self._c_set_attr(set_to_split - {node})))
                                                       )
 
             elif prev_adj[node][0] == 0 and current_adj[node][0] != 0:
@@ -155,7 +174,7 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
                 self.component_sets_table.remove_set(other_set)
                 self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                other_set | {node},
-                                                               **(self._c_set_attr_function(other_set | {node})))
+                                                               **(self._c_set_attr(other_set | {node})))
                                                   )
                 break
 
@@ -191,7 +210,7 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
                     self.component_sets_table.remove_set(adj_node_set)
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                    adj_node_set | {node},
-                                                                   **(self._c_set_attr_function(adj_node_set | {node})))
+                                                                   **(self._c_set_attr(adj_node_set | {node})))
                                                       )
 
             elif prev_adj[node][0] == 1 and current_adj[node][0] == 0:
@@ -199,10 +218,10 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
                 self.component_sets_table.remove_set(set_to_split)
                 self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                {node},
-                                                               **(self._c_set_attr_function({node}))))
+                                                               **(self._c_set_attr({node}))))
                 self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                set_to_split - {node},
-                                                               **(self._c_set_attr_function(set_to_split - {node})))
+                                                               **(self._c_set_attr(set_to_split - {node})))
                                                   )
                 other_node = b if node == a else a
                 if prev_adj[other_node][0] == 1 and current_adj[other_node][0] == 0:
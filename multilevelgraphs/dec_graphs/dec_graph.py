@@ -1,6 +1,64 @@
-from typing import Optional, Set, Dict, Any, Iterable, FrozenSet
+import threading
+from typing import Optional, Set, Dict, Any, Iterable, FrozenSet, Callable
 import networkx as nx
 
+# Guards the hand-off of deferred attribute updates of supernodes and superedges. It is only held to claim a
+# deferred update and to publish its result, never while an attribute function is running, so that deferred
+# updates of different elements are evaluated concurrently.
+_deferred_update_lock = threading.Lock()
+
+
+class _DeferredUpdateInProgress:
+    """
+    Replaces the pending attribute function of a supernode or superedge while its deferred update is being applied
+    by the thread ``owner``, letting the other threads reading the same element wait for ``done``.
+    """
+
+    __slots__ = ('attr_function', 'owner', 'done')
+
+    def __init__(self, attr_function: Callable):
+        self.attr_function = attr_function
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+
+
+def _apply_deferred_update(element):
+    """
+    Applies the deferred attribute update of the given supernode or superedge, if any.
+    The attribute function is evaluated once, by the first thread reading the element, while the other threads
+    wait for its result. An attribute function reading the attributes of the element it is applied to reads the
+    attributes preceding the update.
+
+    :param element: the supernode or superedge
+    """
+    while True:
+        with _deferred_update_lock:
+            pending = element._pending_attr_function
+            if pending is None:
+                return
+            if not isinstance(pending, _DeferredUpdateInProgress):
+                in_progress = _DeferredUpdateInProgress(pending)
+                element._pending_attr_function = in_progress
+                break
+            if pending.owner == threading.get_ident():
+                return
+        pending.done.wait()
+
+    try:
+        attr = in_progress.attr_function(element)
+    except BaseException:
+        with _deferred_update_lock:
+            if element._pending_attr_function is in_progress:
+                element._pending_attr_function = in_progress.attr_function
+        in_progress.done.set()
+        raise
+    with _deferred_update_lock:
+        element.attr.update(attr)
+        # An update deferred again while this one was being applied is kept pending
+        if element._pending_attr_function is in_progress:
+            element._pending_attr_function = None
+    in_progress.done.set()
+
 
 class DecGraph:
     """
@@ -145,7 +203,7 @@ class DecGraph:
         :param node: the supernode to get the degree
         :return: the degree of the supernode
         """
-        return self.graph().degree(node.key)
+        return self._graph.degree(node.key)
 
     def forward_star(self, node: 'Supernode') -> Set['Supernode']:
         """
@@ -155,7 +213,7 @@ class DecGraph:
         :param node: the supernode to get the forward star
         :return: the forward star of the supernode
         """
-        return {self.V[key] for key in self.graph().successors(node.key)}
+        return {self.V[key] for key in self._graph.successors(node.key)}
 
     def reverse_star(self, node: 'Supernode') -> Set['Supernode']:
         """
@@ -165,7 +223,7 @@ class DecGraph:
         :param node: the supernode to get the reverse star
         :return: the reverse star of the supernode
         """
-        return {self.V[key] for key in self.graph().predecessors(node.key)}
+        return {self.V[key] for key in self._graph.predecessors(node.key)}
 
     def out_edges(self, node: 'Supernode') -> Set['Superedge']:
         """
@@ -174,7 +232,7 @@ class DecGraph:
         :param node: the supernode to get the out edges
         :return: the set of superedges that have the given supernode as tail
         """
-        return {self.E[(node.key, head.key)] for head in self.forward_star(node)}
+        return {self.E[(node.key, head_key)] for head_key in self._graph.successors(node.key)}
 
     def in_edges(self, node: 'Supernode') -> Set['Superedge']:
         """
@@ -183,7 +241,7 @@ class DecGraph:
         :param node: the supernode to get the in edges
         :return: the set of superedges that have the given supernode as head
         """
-        return {self.E[(tail.key, node.key)] for tail in self.reverse_star(node)}
+        return {self.E[(tail_key, node.key)] for tail_key in self._graph.predecessors(node.key)}
 
     def graph(self, ref: bool = False, attr: bool = False) -> nx.DiGraph:
         """
@@ -203,9 +261,11 @@ class DecGraph:
             return self._graph
         elif attr:
             graph = nx.DiGraph()
-            for n in self.nodes():
+            for n in self.V.values():
+                n.apply_deferred_update()
                 graph.add_node(n.key, **n.attr)
-            for e in self.edges():
+            for e in self.E.values():
+                e.apply_deferred_update()
                 graph.add_edge(e.tail.key, e.head.key, **e.attr)
             return graph
         else:
@@ -271,10 +331,10 @@ class DecGraph:
 
         :return: the height of the decontractible graph
         """
-        if not self.nodes():
+        if not self.V:
             return -1
         else:
-            return max(node.height() for node in self.nodes())
+            return max(node.height() for node in self.V.values())
 
     def order(self) -> int:
         """
@@ -282,7 +342,7 @@ class DecGraph:
 
         :return: the order of the decontractible graph
         """
-        return len(self.nodes())
+        return len(self.V)
 
     def complete_decontraction(self) -> 'DecGraph':
         """
@@ -299,13 +359,13 @@ class DecGraph:
         """
         complete_decontraction = DecGraph()
 
-        for node in self.nodes():
-            for n in node.dec.nodes():
+        for node in self.V.values():
+            for n in node.dec.V.values():
                 complete_decontraction.add_node(n)
-            for e in node.dec.edges():
+            for e in node.dec.E.values():
                 complete_decontraction.add_edge(e)
 
-        for edge in self.edges():
+        for edge in self.E.values():
             for e in edge.dec:
                 complete_decontraction.add_edge(e)
 
@@ -435,7 +495,9 @@ class Supernode:
     supernode: Optional[Supernode]
         the supernode that this supernode is contracted into, if any
     attr: Dict[str, Any]
-        a dictionary of custom attributes and values to be added to the supernode
+        a dictionary of custom attributes and values to be added to the supernode. If an update of the attributes
+        has been deferred with :meth:`defer_update`, it is applied by reading them through the [] notation or
+        :meth:`get`, while direct reads of this dictionary require :meth:`apply_deferred_update` to be called first
 
     Examples
     --------
@@ -455,7 +517,7 @@ class Supernode:
         print(supernode['weight']) # 20
     """
 
-    __slots__ = ('key', 'level', 'dec', 'component_sets', 'supernode', 'attr')
+    __slots__ = ('key', 'level', 'dec', 'component_sets', 'supernode', 'attr', '_pending_attr_function')
 
     def __init__(self, key,
                  level: int = None,
@@ -479,6 +541,7 @@ class Supernode:
         self.dec = dec if dec is not None else DecGraph()
         self.component_sets = component_sets if component_sets is not None else frozenset()
         self.supernode = supernode
+        self._pending_attr_function = None
         self.attr = attr
 
     def is_in_multi_level_graph(self) -> bool:
@@ -489,6 +552,44 @@ class Supernode:
         """
         return self.level is not None
 
+    def defer_update(self, attr_function: Callable[['Supernode'], Dict[str, Any]]):
+        """
+        Defers the update of the supernode attributes with the ones returned by the given function, applied
+        to this supernode, until the attributes are read for the first time through the [] notation,
+        :meth:`get` or :meth:`update`.
+        A previously deferred update that has not been applied yet is replaced.
+
+        Note that the ``attr`` dictionary does not apply the deferred update when read directly, so
+        :meth:`apply_deferred_update` should be called first.
+
+        :param attr_function: the function returning the attributes to be added to the supernode
+        """
+        self._pending_attr_function = attr_function
+
+    def apply_deferred_update(self):
+        """
+        Applies the update of the supernode attributes deferred with :meth:`defer_update`, if any.
+        This method is safe to call from concurrent threads: the update is applied once, and no lock is held while
+        the attribute function runs. Since the other threads reading this supernode wait for the update, the attribute
+        function must not wait, directly or through the attribute functions it triggers, on a thread reading this
+        supernode.
+        """
+        if self._pending_attr_function is not None:
+            _apply_deferred_update(self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the value of the given custom attribute of the supernode, or the given default value if the
+        supernode has no such attribute.
+
+        :param key: the name of the attribute
+        :param default: the value to return if the supernode has no such attribute
+        :return: the value of the attribute
+        """
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
+        return self.attr.get(key, default)
+
     def add_node(self, supernode: 'Supernode'):
         """
         Adds a supernode to the decontractible graph represented by this supernode.
@@ -565,6 +666,7 @@ class Supernode:
         :param supernode: the reference to the supernode that this supernode is contracted into
         :return: the deep copy of this supernode
         """
+        self.apply_deferred_update()
         return Supernode(key=self.key,
                          level=self.level,
                          dec=self.dec.deepcopy(self),
@@ -595,12 +697,18 @@ class Supernode:
         return str(self)
 
     def __getitem__(self, key: str) -> Any:
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         return self.attr[key]
 
     def __setitem__(self, key: str, value: Any):
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         self.attr[key] = value
 
     def __delitem__(self, key: str):
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         del self.attr[key]
 
     def update(self, **attr):
@@ -609,6 +717,8 @@ class Supernode:
 
         :param attr: the attributes to be added to the supernode
         """
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         self.attr.update(attr)
 
 
@@ -628,7 +738,9 @@ class Superedge:
     dec: Set[Superedge]
         the set of superedges represented by this superedge
     attr: Dict[str, Any]
-        a dictionary of custom attributes and values to be added to the superedge
+        a dictionary of custom attributes and values to be added to the superedge. If an update of the attributes
+        has been deferred with :meth:`defer_update`, it is applied by reading them through the [] notation or
+        :meth:`get`, while direct reads of this dictionary require :meth:`apply_deferred_update` to be called first
 
     Examples
     --------
@@ -650,7 +762,7 @@ class Superedge:
         superedge['weight'] = 20
         print(superedge['weight']) # 20
     """
-    __slots__ = ('tail', 'head', 'level', 'dec', 'attr')
+    __slots__ = ('tail', 'head', 'level', 'dec', 'attr', '_pending_attr_function')
 
     def __init__(self, tail: 'Supernode', head: 'Supernode', level: int = None, dec: Set['Superedge'] = None, **attr):
         """
@@ -666,7 +778,7 @@ class Superedge:
         self.head = head
         self.dec = dec if dec is not None else set()
         for e in self.dec:
-            if e.tail not in self.tail.dec.nodes() or e.head not in self.head.dec.nodes():
+            if self.tail.dec.V.get(e.tail.key) != e.tail or self.head.dec.V.get(e.head.key) != e.head:
                 raise ValueError('The supernodes of the superedge to be added must be included in tail and head'
                                  'decontractions respectively.')
         if level is not None and (
@@ -674,6 +786,7 @@ class Superedge:
             raise ValueError(
                 'The level of the superedge must be the same as the level of the tail and head supernodes.')
         self.level = level
+        self._pending_attr_function = None
         self.attr = attr
 
     def is_in_multi_level_graph(self) -> bool:
@@ -684,6 +797,44 @@ class Superedge:
         """
         return self.level is not None
 
+    def defer_update(self, attr_function: Callable[['Superedge'], Dict[str, Any]]):
+        """
+        Defers the update of the superedge attributes with the ones returned by the given function, applied
+        to this superedge, until the attributes are read for the first time through the [] notation,
+        :meth:`get` or :meth:`update`.
+        A previously deferred update that has not been applied yet is replaced.
+
+        Note that the ``attr`` dictionary does not apply the deferred update when read directly, so
+        :meth:`apply_deferred_update` should be called first.
+
+        :param attr_function: the function returning the attributes to be added to the superedge
+        """
+        self._pending_attr_function = attr_function
+
+    def apply_deferred_update(self):
+        """
+        Applies the update of the superedge attributes deferred with :meth:`defer_update`, if any.
+        This method is safe to call from concurrent threads: the update is applied once, and no lock is held while
+        the attribute function runs. Since the other threads reading this superedge wait for the update, the attribute
+        function must not wait, directly or through the attribute functions it triggers, on a thread reading this
+        superedge.
+        """
+        if self._pending_attr_function is not None:
+            _apply_deferred_update(self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the value of the given custom attribute of the superedge, or the given default value if the
+        superedge has no such attribute.
+
+        :param key: the name of the attribute
+        :param default: the value to return if the superedge has no such attribute
+        :return: the value of the attribute
+        """
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
+        return self.attr.get(key, default)
+
     def add_edge(self, superedge: 'Superedge'):
         """
         Adds a superedge to the superedge set represented by this superedge.
@@ -691,7 +842,8 @@ class Superedge:
 
         :param superedge: the superedge to be added
         """
-        if superedge.tail not in self.tail.dec.nodes() or superedge.head not in self.head.dec.nodes():
+        if self.tail.dec.V.get(superedge.tail.key) != superedge.tail \
+                or self.head.dec.V.get(superedge.head.key) != superedge.head:
             raise ValueError('The supernodes of the superedge to be added must be included in tail and head'
                              'decontractions respectively.')
         if self.level is not None and superedge.level != self.level - 1:
@@ -744,6 +896,7 @@ class Superedge:
         :param v_copies: a dictionary of supernode copies to be used in the recursive calls
         :return: the deep copy of this superedge
         """
+        self.apply_deferred_update()
         sub_v_copies = v_copies[self.tail.key].dec.V | v_copies[self.head.key].dec.V
         return Superedge(tail=v_copies[self.tail.key],
                          head=v_copies[self.head.key],
@@ -772,12 +925,18 @@ class Superedge:
         return str(self)
 
     def __getitem__(self, key: str) -> Any:
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         return self.attr[key]
 
     def __setitem__(self, key: str, value: Any):
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         self.attr[key] = value
 
     def __delitem__(self, key: str):
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         del self.attr[key]
 
     def update(self, **attr):
@@ -786,4 +945,6 @@ class Superedge:
 
         :param attr: the attributes to be added to the superedge
         """
+        if self._pending_attr_function is not None:
+            self.apply_deferred_update()
         self.attr.update(attr)
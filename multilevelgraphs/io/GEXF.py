@@ -62,6 +62,7 @@ def write_gexf(ml_graph: MultilevelGraph, file_path: str, description: str = Non
 
     for key, edge in [key_edge for i in range(ml_graph.height())
                       for key_edge in ml_graph.get_graph(i, deepcopy=False).E.items()]:
+        edge.apply_deferred_update()
         superedge_attr = edge.attr
         if edge.level:
             superedge_attr |= {'level': edge.level}
@@ -110,6 +111,7 @@ def write_gexf_for_viz(ml_graph: MultilevelGraph, file_path: str, description: s
     writer.add_edge_attribute('same_level', bool)
     for key, edge in [key_edge for i in range(ml_graph.height()+1)
                       for key_edge in ml_graph.get_graph(i, deepcopy=False).E.items()]:
+        edge.apply_deferred_update()
         superedge_attr = edge.attr
         if edge.level:
             superedge_attr |= {'level': edge.level}
@@ -127,6 +129,7 @@ def _add_node_and_children(writer: 'GEXFWriter', supernode: Supernode,
                            supernode_element: ET.Element = None):
 
     # Gather supernode attributes
+    supernode.apply_deferred_update()
     supernode_attr = supernode.attr
     if supernode.level:
         supernode_attr |= {'level': supernode.level}
@@ -1,5 +1,5 @@
 import unittest
-from typing import Callable, Dict, Any, Set
+from typing import Callable, Dict, Any, Set, Optional
 
 import networkx as nx
 
@@ -57,6 +57,45 @@ class ContractionSchemeTest(unittest.TestCase):
         self.assertEqual(self._sample_dec_graph(), contracted_graph.complete_decontraction())
         self.assertEqual(30, list(dec_graph.V[1].supernode.component_sets)[0]['weight'])
 
+    def test_contract_with_parallel_attr_functions(self):
+        def supernode_attr_function(supernode: Supernode) -> Dict[str, Any]:
+            return {"weight": sum([node['weight'] for node in supernode.dec.nodes()])}
+
+        def superedge_attr_function(superedge: Superedge) -> Dict[str, Any]:
+            return {"weight": superedge.tail['weight'] + superedge.head['weight']}
+
+        dec_graph = self._sample_dec_graph()
+        scheme = IdentityContractionScheme(supernode_attr_function, superedge_attr_function, parallel_attr_threshold=0)
+        contracted_graph = scheme.contract(dec_graph)
+
+        self.assertEqual(self._sample_dec_graph(), contracted_graph.complete_decontraction())
+        self.assertEqual(30, dec_graph.V[1].supernode['weight'])
+        self.assertEqual(30, contracted_graph.E[(dec_graph.V[2].supernode.key, dec_graph.V[3].supernode.key)]['weight'])
+        self.assertEqual(0, scheme.clone().parallel_attr_threshold)
+
+    def test_contract_with_lazy_attr_functions(self):
+        evaluated = []
+
+        def supernode_attr_function(supernode: Supernode) -> Dict[str, Any]:
+            evaluated.append(supernode.key)
+            return {"weight": sum([node['weight'] for node in supernode.dec.nodes()])}
+
+        dec_graph = self._sample_dec_graph()
+        scheme = IdentityContractionScheme(supernode_attr_function, lazy_attr=True)
+        scheme.contract(dec_graph)
+
+        self.assertEqual([], evaluated)
+        self.assertEqual(30, dec_graph.V[1].supernode['weight'])
+        self.assertEqual([dec_graph.V[1].supernode.key], evaluated)
+        self.assertEqual(30, dec_graph.V[1].supernode['weight'])
+        self.assertEqual(20, dec_graph.V[2].supernode.get('weight'))
+        self.assertEqual(2, len(evaluated))
+        self.assertNotIn('weight', dec_graph.V[3].supernode.attr)
+
+        scheme.force_update_attr()
+        self.assertEqual(len(scheme.dec_graph.V), len(evaluated))
+        self.assertIn('weight', dec_graph.V[3].supernode.attr)
+
     def test_update_graph(self):
         dec_graph = self._sample_dec_graph()
         scheme = IdentityContractionScheme()
@@ -78,6 +117,18 @@ class ContractionSchemeTest(unittest.TestCase):
         self.assertEqual(1, len(new_component_sets))
         self.assertEqual("test", next(iter(new_component_sets))['test_attribute'])
 
+    def test_update_graph_with_unorderable_c_set_keys(self):
+        dec_graph = self._sample_dec_graph()
+        scheme = IdentityContractionScheme()
+        scheme.contract(dec_graph)
+
+        # Node 1 belongs to two component sets whose keys cannot be compared with each other
+        scheme.component_sets_table.add_set(ComponentSet(key="extra", supernodes={dec_graph.V[1]}))
+        scheme._update_graph()
+
+        self.assertEqual(4, len(scheme.dec_graph.nodes()))
+        self.assertEqual(2, len(dec_graph.V[1].supernode.component_sets))
+
     @staticmethod
     def _sample_dec_graph() -> DecGraph:
         graph = DecGraph()
@@ -99,8 +150,16 @@ class IdentityContractionScheme(ContractionScheme):
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
-                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None):
-        super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
+                 c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
+                 parallel_attr_threshold: Optional[int] = None,
+                 parallel_contraction_threshold: Optional[int] = None,
+                 lazy_attr: bool = False):
+        super().__init__(supernode_attr_function,
+                         superedge_attr_function,
+                         c_set_attr_function,
+                         parallel_attr_threshold=parallel_attr_threshold,
+                         parallel_contraction_threshold=parallel_contraction_threshold,
+                         lazy_attr=lazy_attr)
 
     def contraction_name(self) -> str:
         return "identity"
@@ -109,7 +168,10 @@ class IdentityContractionScheme(ContractionScheme):
         return IdentityContractionScheme(
             self._supernode_attr_function,
             self._superedge_attr_function,
-            self._c_set_attr_function
+            self._c_set_attr_function,
+            parallel_attr_threshold=self.parallel_attr_threshold,
+            parallel_contraction_threshold=self.parallel_contraction_threshold,
+            lazy_attr=self.lazy_attr
         )
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
@@ -1,4 +1,8 @@
+import threading
+import time
 import unittest
+from multiprocessing.pool import ThreadPool
+
 from multilevelgraphs import DecGraph, Supernode, Superedge
 
 
@@ -230,6 +234,41 @@ class DecGraphTest(unittest.TestCase):
         self.assertEqual(0, len(dec_graph.out_edges(self.test_supernodes_2[1])))
         self.assertEqual({self.test_superedges_2[0]}, dec_graph.out_edges(self.test_supernodes_2[0]))
 
+    def test_deferred_update_applied_once_by_concurrent_readers(self):
+        evaluated = []
+
+        def attr_function(supernode: Supernode):
+            evaluated.append(supernode.key)
+            time.sleep(0.01)
+            return {'weight': 10, 'size': 2}
+
+        supernode = Supernode(1, 0, weight=1)
+        supernode.defer_update(attr_function)
+        self.assertEqual(1, supernode.attr['weight'])
+
+        with ThreadPool(8) as pool:
+            results = pool.map(lambda _: (supernode['weight'], supernode.get('size')), range(32))
+
+        self.assertEqual([(10, 2)] * 32, results)
+        self.assertEqual([1], evaluated)
+
+    def test_deferred_updates_of_different_supernodes_applied_concurrently(self):
+        # Each attribute function completes only once the other one is running as well
+        barrier = threading.Barrier(2, timeout=5)
+
+        def attr_function(supernode: Supernode):
+            barrier.wait()
+            return {'weight': supernode.key * 10}
+
+        supernodes = [Supernode(1, 0, weight=1), Supernode(2, 0, weight=2)]
+        for supernode in supernodes:
+            supernode.defer_update(attr_function)
+
+        with ThreadPool(2) as pool:
+            results = pool.map(lambda supernode: supernode['weight'], supernodes)
+
+        self.assertEqual([10, 20], results)
+
     def _build_test_graph_1(self) -> DecGraph:
         for i in range(3):
             self.test_supernodes_1[i].add_node(self.test_supernodes_0[2 * i])
@@ -288,6 +288,66 @@ class MultilevelGraphTest(unittest.TestCase):
         self.assertTrue(1, len(ml_graph.get_graph(0).V[1].supernode.supernode.component_sets))
         self.assertTrue(1, len(next(iter(ml_graph.get_graph(0).V[1].supernode.supernode.component_sets))))
 
+    def test_update_attr_propagation(self):
+        def supernode_attr_function(supernode):
+            return {'weight': sum(node['weight'] for node in supernode.dec.nodes()) +
+                              sum(edge['weight'] for edge in supernode.dec.edges())}
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from([(1, {'weight': 1}), (2, {'weight': 2}), (3, {'weight': 3}), (4, {'weight': 4})])
+        graph.add_edges_from([(1, 2, {'weight': 10}), (2, 3, {'weight': 20}), (3, 1, {'weight': 30}),
+                              (3, 4, {'weight': 40})])
+
+        ml_graph = MultilevelGraph(graph, [SCCsContractionScheme(supernode_attr_function),
+                                           SCCsContractionScheme(supernode_attr_function)])
+        ml_graph.build_contraction_schemes()
+        self.assertEqual(66, ml_graph[0].V[1].supernode['weight'])
+        self.assertEqual(66, ml_graph[2].V[ml_graph[0].V[1].supernode.supernode.key]['weight'])
+
+        ml_graph.add_edge(1, 3, weight=50)
+        ml_graph.build_contraction_schemes()
+        self.assertEqual(116, ml_graph[0].V[1].supernode['weight'])
+        self.assertEqual(116, ml_graph[2].V[ml_graph[0].V[1].supernode.supernode.key]['weight'])
+        self.assertEqual(4, ml_graph[0].V[4].supernode.supernode['weight'])
+
+    def test_update_attr_refreshes_only_affected_supernodes(self):
+        evaluated = []
+
+        def supernode_attr_function(supernode):
+            evaluated.append(supernode.key)
+            return {'size': len(supernode.dec.nodes())}
+
+        graph = nx.DiGraph()
+        for i in range(0, 300, 3):
+            graph.add_edges_from([(i, i + 1), (i + 1, i + 2), (i + 2, i)])
+
+        ml_graph = MultilevelGraph(graph, [SCCsContractionScheme(supernode_attr_function)])
+        ml_graph.build_contraction_schemes()
+        self.assertEqual(100, len(evaluated))
+
+        evaluated.clear()
+        ml_graph.add_edge(0, 2)
+        ml_graph.build_contraction_schemes()
+        self.assertEqual([ml_graph[0].V[0].supernode.key], evaluated)
+
+    def test_update_attr_of_superedge_removed_and_recreated(self):
+        def superedge_attr_function(superedge):
+            return {'weight': sum(edge['weight'] for edge in superedge.dec)}
+
+        graph = nx.DiGraph()
+        graph.add_edges_from([(1, 2), (2, 1), (2, 3), (3, 2), (1, 3), (3, 1)], weight=1)
+        graph.add_edge(1, 4, weight=5)
+
+        ml_graph = MultilevelGraph(graph, [CyclesContractionScheme(superedge_attr_function=superedge_attr_function)])
+        ml_graph.build_contraction_schemes()
+
+        # The superedge is removed along with its only edge, then recreated with the same endpoints
+        ml_graph.remove_edge(1, 4)
+        ml_graph.add_edge(2, 4, weight=7)
+        ml_graph.build_contraction_schemes()
+        superedge = ml_graph[1].E[(ml_graph[0].V[2].supernode.key, ml_graph[0].V[4].supernode.key)]
+        self.assertEqual({'weight': 7}, superedge.attr)
+
     def get_sample_graph_1(self):
         graph = nx.DiGraph()
         graph.add_node(1, weight=20)
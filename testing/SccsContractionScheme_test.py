@@ -21,6 +21,20 @@ class SccsContractionSchemeTest(unittest.TestCase):
         self.assertEqual(2, len(sample_graph.V[4].supernode.dec.edges()))
         self.assertEqual(1, len(contracted_graph.E[(sample_graph.V[1].supernode.key, sample_graph.V[4].supernode.key)].dec))
 
+    def test_contract_in_parallel(self):
+        sample_graph = self._sample_dec_graph()
+        scheme = SCCsContractionScheme(parallel_contraction_threshold=0)
+        contracted_graph = scheme.contract(sample_graph)
+
+        self.assertEqual(2, len(contracted_graph.nodes()))
+        self.assertEqual(1, len(contracted_graph.edges()))
+        self.assertEqual(self._sample_dec_graph(), contracted_graph.complete_decontraction())
+        self.assertEqual(3, len(sample_graph.V[1].supernode.dec.edges()))
+        self.assertEqual(2, len(sample_graph.V[4].supernode.dec.edges()))
+        self.assertEqual(1, len(contracted_graph.E[(sample_graph.V[1].supernode.key, sample_graph.V[4].supernode.key)].dec))
+        self.assertEqual(0, scheme.clone().parallel_contraction_threshold)
+        self.assertIsNone(SCCsContractionScheme().parallel_contraction_threshold)
+
     def test_contract_with_supernode_attr_function(self):
         def supernode_attr_function(supernode: Supernode):
             return {"weight": sum([node['weight'] for node in supernode.dec.nodes()]) + 1}
@@ -62,6 +76,19 @@ class SccsContractionSchemeTest(unittest.TestCase):
         self.assertEqual(63, list(sample_graph.V[1].supernode.component_sets)[0]['weight'])
         self.assertEqual(32, list(sample_graph.V[4].supernode.component_sets)[0]['weight'])
 
+    def test_contract_evaluates_c_set_attr_function_once(self):
+        evaluated_c_sets = []
+
+        def c_set_attr_function(c_set):
+            evaluated_c_sets.append(frozenset(c_set))
+            return {"size": len(c_set)}
+
+        sample_graph = self._sample_dec_graph()
+        SCCsContractionScheme(c_set_attr_function=c_set_attr_function).contract(sample_graph)
+
+        self.assertEqual(2, len(evaluated_c_sets))
+        self.assertEqual(3, list(sample_graph.V[1].supernode.component_sets)[0]['size'])
+
     def test_update_added_node(self):
         sample_graph = self._sample_dec_graph()
         scheme = SCCsContractionScheme()
@@ -207,6 +234,25 @@ class SccsContractionSchemeTest(unittest.TestCase):
                          scheme.dec_graph.E[(sample_graph.V[4].supernode.key, sample_graph.V[5].supernode.key)].dec)
         self.assertEqual(sample_graph, scheme.dec_graph.complete_decontraction())
 
+    def test_update_removed_edges_batch(self):
+        sample_graph = self._sample_dec_graph()
+        scheme = SCCsContractionScheme()
+        scheme.contract(sample_graph)
+
+        removed_edge_1 = sample_graph.E[(2, 3)]
+        removed_edge_2 = sample_graph.E[(5, 4)]
+        sample_graph.remove_edge(removed_edge_1)
+        sample_graph.remove_edge(removed_edge_2)
+        quadruple = UpdateQuadruple(v_plus=set(), v_minus=set(), e_plus=set(), e_minus={removed_edge_1, removed_edge_2})
+
+        scheme.update(quadruple)
+
+        self.assertEqual(5, len(scheme.dec_graph.V))
+        self.assertEqual(4, len(scheme.dec_graph.E))
+        self.assertTrue(all(len(supernode.dec.nodes()) == 1 for supernode in scheme.dec_graph.nodes()))
+        self.assertEqual(5, len(scheme.component_sets_table.get_all_c_sets()))
+        self.assertEqual(sample_graph, scheme.dec_graph.complete_decontraction())
+
     def test_update_removed_edge_and_node(self):
         sample_graph = self._sample_dec_graph()
         scheme = SCCsContractionScheme()